@@ -5,14 +5,24 @@ Healthcare Activity/Obesity ETL (Associate DE level)
 - Reads raw WHO CSVs from ADLS Gen2 with metadata before/after the table
 - Detects header by column names, detects end by "3-commas"/4-column rule
 - Builds processed activity/obesity layers and an inner-joined curated layer
+- Writes Parquet (Snappy) by default; CSV is opt-in
 - Includes logging, basic validations, and clean parameterization
 """
+import io
 import os
+import re
 import argparse
+import hashlib
 import logging
-from typing import Iterable, List, Tuple, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from typing import Callable, Dict, Iterable, List, Tuple, Sequence
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 from adlfs import AzureBlobFileSystem
 from pathlib import Path
 
@@ -20,6 +30,19 @@ from pathlib import Path
 
 LOG = logging.getLogger("health_etl")
 
+# Types are applied inside pyarrow's C parser, so no pd.to_numeric pass afterwards
+CSV_CONVERT_OPTIONS = pa_csv.ConvertOptions(
+    column_types={
+        "COUNTRY": pa.dictionary(pa.int32(), pa.string()),
+        "SEX": pa.dictionary(pa.int32(), pa.string()),
+        "YEAR": pa.int16(),
+        "VALUE": pa.float64(),
+    },
+    null_values=pa_csv.ConvertOptions().null_values + ["No data"],
+    strings_can_be_null=True,  # empty COUNTRY/SEX must stay null for validate_keys
+)
+PARQUET_KWARGS = {"index": False, "engine": "pyarrow", "compression": "snappy"}
+
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Build processed & curated datasets for Health BI.")
     p.add_argument("--account", required=True, help="ADLS Gen2 account name")
@@ -28,8 +51,10 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--ages", nargs="+", type=int, default=[11, 13, 15], help="Ages to process")
     p.add_argument("--activity-prefix", default="Percentages of physically active children among")
     p.add_argument("--obesity-prefix",  default="Prevalence of overweight (including obesity) among")
-    p.add_argument("--write-parquet", action="store_true", help="Also write Parquet outputs")
+    p.add_argument("--write-parquet", action="store_true", help="No-op: Parquet is always written (kept for compatibility)")
+    p.add_argument("--write-csv", action="store_true", help="Also write CSV outputs")
     p.add_argument("--dry-run", action="store_true", help="Run validations; skip writes")
+    p.add_argument("--force", action="store_true", help="Rebuild even if raw inputs are unchanged since the last run")
     p.add_argument("--debug", action="store_true", help="Verbose logs")
     return p.parse_args()
 
@@ -46,37 +71,94 @@ def setup_logging(debug: bool) -> None:
 
 # ------------------------- Path helpers -------------------------
 
-def abfs_path(container: str, *parts: str) -> str:
-    """abfs:// path for pandas read_csv/to_csv with storage_options."""
-    return "abfs://" + "/".join([container.strip("/")] + [p.strip("/") for p in parts])
-
 def noscheme_path(container: str, *parts: str) -> str:
-    """No-scheme path for abfs.open(...)."""
+    """No-scheme path for fs.open(...) reads and writes."""
     return "/".join([container.strip("/")] + [p.strip("/") for p in parts])
 
+def raw_path(container: str, prefix: str, age: int) -> str:
+    """No-scheme path of one raw age file."""
+    return noscheme_path(container, "raw", f"{prefix} {age}-year-olds.csv")
+
 # ------------------------- Core logic -------------------------
 
-def find_table_bounds(lines: Sequence[str], required_cols: Iterable[str]) -> Tuple[int, int]:
+@dataclass
+class IdPool:
+    """
+    Shared COUNTRY/SEX -> int id dictionaries, filled across measures.
+    Every frame encoded through one pool carries identical category codes,
+    so joins hash small ints instead of strings.
+    """
+    country_to_id: Dict[str, int] = field(default_factory=dict)
+    sex_to_id: Dict[str, int] = field(default_factory=dict)
+
+    def _mapping(self, col: str) -> Dict[str, int]:
+        """Dictionary for a pooled column; any other name is a KeyError, never a silent fallback."""
+        return {"COUNTRY": self.country_to_id, "SEX": self.sex_to_id}[col]
+
+    def codes(self, col: str, values: pd.Series) -> np.ndarray:
+        """Pooled int32 ids for COUNTRY/SEX values (-1 for nulls); new values get the next id."""
+        mapping = self._mapping(col)
+        cat = pd.Categorical(values)
+        # Remap per category, not per row; the trailing -1 keeps nulls null
+        lookup = np.array([mapping.setdefault(v, len(mapping)) for v in cat.categories] + [-1], dtype=np.int32)
+        return lookup[cat.codes]
+
+    def categorical(self, col: str, codes: np.ndarray) -> pd.Categorical:
+        """Pooled ids back to a categorical over the pool's current values."""
+        return pd.Categorical.from_codes(codes, categories=list(self._mapping(col)))
+
+    def align(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Widen COUNTRY/SEX to the full pool in place (ids are append-only, so codes are
+        unchanged); only those two columns are rebuilt, the rest of df is not copied.
+        """
+        for col in ("COUNTRY", "SEX"):
+            df[col] = df[col].cat.set_categories(list(self._mapping(col)))
+        return df
+
+@lru_cache(maxsize=None)
+def _header_pattern(required_cols: Tuple[str, ...]) -> "re.Pattern[bytes]":
+    """One compiled regex matching the first line that contains every required column."""
+    lookaheads = b"".join(b"(?=[^\n]*" + re.escape(col.encode("utf-8")) + b")" for col in required_cols)
+    return re.compile(b"^" + lookaheads, re.MULTILINE)
+
+def _count_data_rows(data: bytes, start: int = 0) -> Tuple[int, int]:
+    """
+    Count contiguous lines from data[start:] that have exactly 3 commas (4 columns).
+    Return (data_rows, end_offset), end_offset being the byte just past the last data line.
+    Vectorized: commas are summed per line segment in C (np.add.reduceat), with no
+    per-byte int64 temporaries.
+    """
+    if start >= len(data):
+        return 0, len(data)
+    arr = np.frombuffer(data, dtype=np.uint8, offset=start)
+    line_ends = np.flatnonzero(arr == ord("\n"))
+    if arr[-1] != ord("\n"):
+        line_ends = np.append(line_ends, arr.size - 1)
+    line_starts = np.concatenate(([0], line_ends[:-1] + 1))
+    per_line = np.add.reduceat((arr == ord(",")).view(np.uint8), line_starts, dtype=np.int32)
+    bad = np.flatnonzero(per_line != 3)
+    data_rows = int(bad[0]) if bad.size else int(per_line.size)
+    end_offset = start + int(line_ends[data_rows - 1]) + 1 if data_rows else start
+    return data_rows, end_offset
+
+def scan_table_bounds(data: bytes, required_cols: Iterable[str]) -> Tuple[int, int, int, int]:
     """
-    Return (header_idx, data_rows).
-    - header_idx: 0-based index of header line containing all required_cols
-    - data_rows: number of contiguous data lines after header that have exactly 3 commas (4 columns)
+    Return (header_idx, data_rows, header_offset, table_end) from the raw file bytes.
+    - header_offset: byte offset where the header line starts, so a parser can
+      seek straight to the table instead of re-skipping metadata lines
+    - table_end: byte offset just past the last data line
     """
-    header_idx = None
-    for i, line in enumerate(lines):
-        if all(col in line for col in required_cols):
-            header_idx = i
-            break
-    if header_idx is None:
+    match = _header_pattern(tuple(required_cols)).search(data)
+    if match is None:
         raise ValueError("Header not found.")
+    header_offset = match.start()
+    header_idx = data.count(b"\n", 0, header_offset)
+    nl = data.find(b"\n", header_offset)
+    line_end = len(data) if nl == -1 else nl
 
-    data_rows = 0
-    for line in lines[header_idx + 1:]:
-        if line.count(",") == 3:
-            data_rows += 1
-        else:
-            break
-    return header_idx, data_rows
+    data_rows, table_end = _count_data_rows(data, line_end + 1)
+    return header_idx, data_rows, header_offset, table_end
 
 def read_measure(
     fs: AzureBlobFileSystem,
@@ -84,67 +166,152 @@ def read_measure(
     ages: List[int],
     prefix: str,
     required_cols: Tuple[str, ...] = ("COUNTRY", "SEX", "YEAR", "VALUE"),
-    storage_options: dict | None = None,
+    id_pool: IdPool | None = None,
+    value_name: str = "VALUE",
 ) -> pd.DataFrame:
     """
     Read + stack one measure (activity OR obesity) across ages.
+    The measure column is emitted as value_name, so callers need no rename (copy).
+    Each raw blob is downloaded once (ages in parallel); bounds detection and the
+    pyarrow parse share the same bytes.
+    COUNTRY/SEX come back as categoricals coded by id_pool (or a private pool).
     """
 
-    dfs: List[pd.DataFrame] = []
-
-    for age in ages:
-        raw_name = f"{prefix} {age}-year-olds.csv"
-        ns_path = noscheme_path(container, "raw", raw_name)
-        scheme_path = abfs_path(container, "raw", raw_name)
+    def _fetch_one(age: int) -> pd.DataFrame | None:
+        ns_path = raw_path(container, prefix, age)
+        raw_name = ns_path.rsplit("/", 1)[-1]
 
-        with fs.open(ns_path, "r", encoding="utf-8-sig") as f:
-            lines = f.readlines()
+        with fs.open(ns_path, "rb") as f:
+            data = f.read()
 
-        header_idx, data_rows = find_table_bounds(lines, required_cols)
+        header_idx, data_rows, header_offset, table_end = scan_table_bounds(data, required_cols)
         LOG.info(f"[{raw_name}] header_idx={header_idx}, data_rows={data_rows}")
 
         if data_rows == 0:
             LOG.warning(f"[{raw_name}] No data rows detected; skipping.")
-            continue
+            return None
 
-        df = pd.read_csv(
-            scheme_path,
-            skiprows=header_idx, 
-            nrows=data_rows,          
-            storage_options=storage_options,
+        # Parse only header + data lines; types are fixed up front, dims arrive dictionary-encoded
+        table = pa_csv.read_csv(
+            pa.BufferReader(pa.py_buffer(data)[header_offset:table_end]),
+            convert_options=CSV_CONVERT_OPTIONS,
         )
-
-        # Standardize types early and add AGE
-        df["YEAR"] = pd.to_numeric(df["YEAR"], errors="raise").astype("int64")
-        df["VALUE"] = pd.to_numeric(df["VALUE"], errors="coerce")
-        df["AGE"] = age
-
-        dfs.append(df)
-
-    if not dfs:
-        return pd.DataFrame(columns=["COUNTRY", "SEX", "YEAR", "VALUE", "AGE"])
-
-    return pd.concat(dfs, ignore_index=True)
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+
+    # Downloads are network-bound; one thread per age overlaps the round-trips
+    with ThreadPoolExecutor(max_workers=max(1, len(ages))) as ex:
+        parsed = [(age, df) for age, df in zip(ages, ex.map(_fetch_one, ages)) if df is not None]
+
+    # Fill one preallocated set of columns instead of concatenating per-age frames;
+    # narrow ints (years fit int16, ages int8) and pooled category codes keep rows small.
+    # Runs in the calling thread: pool ids must be assigned sequentially.
+    pool = id_pool if id_pool is not None else IdPool()
+    total = sum(len(df) for _, df in parsed)
+    out = {
+        "COUNTRY": np.empty(total, dtype=np.int32),
+        "SEX": np.empty(total, dtype=np.int32),
+        "YEAR": np.empty(total, dtype=np.int16),
+        value_name: np.empty(total, dtype=np.float64),
+        "AGE": np.empty(total, dtype=np.int8),
+    }
+    off = 0
+    for age, df in parsed:
+        n = len(df)
+        out["COUNTRY"][off:off + n] = pool.codes("COUNTRY", df["COUNTRY"])
+        out["SEX"][off:off + n] = pool.codes("SEX", df["SEX"])
+        out["YEAR"][off:off + n] = df["YEAR"].astype("int16").to_numpy()  # raises on missing years
+        out[value_name][off:off + n] = df["VALUE"].to_numpy()
+        out["AGE"][off:off + n] = age
+        off += n
+
+    out["COUNTRY"] = pool.categorical("COUNTRY", out["COUNTRY"])
+    out["SEX"] = pool.categorical("SEX", out["SEX"])
+    return pd.DataFrame(out, copy=False)
+
+def has_nulls(s: pd.Series) -> bool:
+    """Null check dispatched on dtype; skips the boolean-frame allocation of isnull()."""
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        return bool((s.cat.codes.to_numpy() == -1).any())
+    if pd.api.types.is_integer_dtype(s.dtype) and not pd.api.types.is_extension_array_dtype(s.dtype):
+        return False  # numpy ints cannot hold nulls
+    if pd.api.types.is_float_dtype(s.dtype) and not pd.api.types.is_extension_array_dtype(s.dtype):
+        return bool(np.isnan(s.to_numpy()).any())
+    return bool(s.isna().any())
+
+def top_duplicate_keys(df: pd.DataFrame, keys: List[str], dup_mask: pd.Series, n: int = 10) -> pd.Series:
+    """Most frequent duplicated key combos; observed=True so unused categories don't add zero rows."""
+    return (
+        df.loc[dup_mask, keys].groupby(keys, observed=True).size()
+          .sort_values(ascending=False)
+          .head(n)
+    )
 
 def validate_keys(df: pd.DataFrame, keys: List[str], name: str) -> None:
     """Basic key hygiene: not empty, no nulls in keys, no duplicate key rows."""
     if df.empty:
         raise AssertionError(f"{name} is empty.")
-    if df[keys].isnull().any().any():
+    if any(has_nulls(df[col]) for col in keys):
         bad = df[df[keys].isnull().any(axis=1)]
         raise AssertionError(f"{name} has null key values. Sample:\n{bad.head(5)}")
-    dup_count = df.duplicated(subset=keys, keep=False).sum()
+    dup_mask = df.duplicated(subset=keys, keep=False)
+    dup_count = int(dup_mask.sum())
     if dup_count:
-        dup_keys = (
-            df.groupby(keys).size()
-              .loc[lambda s: s > 1]
-              .sort_values(ascending=False)
-              .head(10)
-        )
+        dup_keys = top_duplicate_keys(df, keys, dup_mask)
         raise AssertionError(f"{name} has {dup_count} duplicate rows on keys. Top combos:\n{dup_keys}")
 
 # ------------------------- Orchestration -------------------------
 
+def run_concurrently(tasks: Sequence[Callable[[], object]]) -> None:
+    """Run independent I/O-bound tasks (e.g. ADLS uploads) in threads; re-raise the first failure."""
+    with ThreadPoolExecutor(max_workers=max(1, len(tasks))) as ex:
+        futures = [ex.submit(task) for task in tasks]
+        for fut in futures:
+            fut.result()
+
+def input_fingerprint(fs: AzureBlobFileSystem, paths: Sequence[str], *options: object) -> str | None:
+    """
+    Short hash of the raw blobs' version (etag, else last_modified) and size plus
+    output-affecting options. None if a blob exposes no version, so it can't be cached.
+    """
+    with ThreadPoolExecutor(max_workers=max(1, len(paths))) as ex:
+        infos = dict(zip(paths, ex.map(fs.info, paths)))
+    entries = []
+    for path, info in sorted(infos.items()):
+        version = info.get("etag") or info.get("last_modified")
+        if version is None:
+            LOG.warning(f"[{path}] no etag/last_modified; rerun cache disabled.")
+            return None
+        entries.append((path, str(version), info.get("size")))
+    return hashlib.blake2b((str(entries) + repr(options)).encode("utf-8")).hexdigest()[:16]
+
+def outputs_current(marker: Path, fp: str | None, force: bool = False) -> bool:
+    """True if the last successful run recorded this same fingerprint (and --force isn't set)."""
+    if fp is None or force or not marker.exists():
+        return False
+    return marker.read_text(encoding="utf-8").strip() == fp
+
+def frame_bytes(df: pd.DataFrame, fmt: str) -> bytes:
+    """Serialize df once to Parquet or CSV bytes, for reuse across several destinations."""
+    buf = io.BytesIO()
+    if fmt == "parquet":
+        df.to_parquet(buf, **PARQUET_KWARGS)
+    else:
+        df.to_csv(buf, index=False)
+    return buf.getvalue()
+
+def upload_bytes(fs: AzureBlobFileSystem, data: bytes, ns_path: str) -> None:
+    """Write already-serialized bytes to ADLS through the shared fs connection pool."""
+    with fs.open(ns_path, "wb") as out:
+        out.write(data)
+
+def upload_frame(fs: AzureBlobFileSystem, df: pd.DataFrame, ns_path: str) -> None:
+    """Write df to ADLS as Parquet or CSV (by extension) through the shared fs connection pool."""
+    with fs.open(ns_path, "wb") as out:
+        if ns_path.endswith(".parquet"):
+            df.to_parquet(out, **PARQUET_KWARGS)
+        else:
+            df.to_csv(out, index=False)
+
 def main() -> int:
     args = parse_args()
     setup_logging(args.debug)
@@ -155,19 +322,40 @@ def main() -> int:
     fs = AzureBlobFileSystem(account_name=args.account, sas_token=args.sas)
     keys = ["COUNTRY", "AGE", "SEX", "YEAR"]
 
-    # Read & rename processed layers
-    opts = {"account_name": args.account, "sas_token": args.sas}
+    # Skip the whole rebuild if the outputs were last written from these exact inputs.
+    # Dry runs always validate, so they never consult the marker.
+    local_dir = Path(__file__).resolve().parents[1] / "data" / "curated"
+    marker = local_dir / "_cache" / "last_fingerprint"
+    fp = None
+    if not args.dry_run:
+        raw_paths = [
+            raw_path(args.container, prefix, age)
+            for prefix in (args.activity_prefix, args.obesity_prefix)
+            for age in args.ages
+        ]
+        fp = input_fingerprint(fs, raw_paths, args.container, args.write_csv)
+        if outputs_current(marker, fp, args.force):
+            LOG.info(f"Inputs unchanged since the last successful run (fingerprint {fp}); "
+                     "outputs are up to date. Use --force to rebuild.")
+            return 0
+
+    # Read processed layers (measure columns named on the way out)
+    pool = IdPool()
 
     df_activity = read_measure(
         fs, args.container, args.ages, args.activity_prefix,
-        storage_options=opts
-    ).rename(columns={"VALUE": "ACTIVITY_VAL"})
+        id_pool=pool, value_name="ACTIVITY_VAL",
+    )
 
     df_obesity = read_measure(
         fs, args.container, args.ages, args.obesity_prefix,
-        storage_options=opts
-    ).rename(columns={"VALUE": "OBESITY_VAL"})
-        
+        id_pool=pool, value_name="OBESITY_VAL",
+    )
+
+    # Same category dtype on both sides -> pandas joins on the integer codes
+    df_activity = pool.align(df_activity)
+    df_obesity = pool.align(df_obesity)
+
     LOG.info(f"Row counts: activity={len(df_activity)}, obesity={len(df_obesity)}")
 
     # Validate key hygiene
@@ -175,41 +363,60 @@ def main() -> int:
     validate_keys(df_obesity,  keys, "obesity")
 
     # Inner join for apples-to-apples comparison
-    df_merged = pd.merge(df_activity, df_obesity, on=keys, how="inner", validate="one_to_one")
+    df_merged = pd.merge(df_activity, df_obesity, on=keys, how="inner")
+    if df_merged.duplicated(subset=keys).any():
+        raise AssertionError("merged has duplicate rows on keys; expected one-to-one join.")
     LOG.info(f"Merged rows={len(df_merged)} (inner on {keys})")
 
     if args.dry_run:
         LOG.info("--dry-run: validations complete; skipping writes.")
         return 0
     
+    # Outputs are about to change; a failure part-way must not leave a stale marker
+    marker.unlink(missing_ok=True)
+
+    # Curated frame is serialized once per format; the same bytes go to the
+    # local snapshot and ADLS
+    merged_parq = frame_bytes(df_merged, "parquet")
+    merged_csv = frame_bytes(df_merged, "csv") if args.write_csv else None
+
     # --- Local snapshot for reproducibility ---
-    local_dir = Path(__file__).resolve().parents[1] / "data" / "curated"
     local_dir.mkdir(parents=True, exist_ok=True)
-    (df_merged
-        .to_csv(local_dir / "df_merged.csv", index=False))
-    LOG.info(f"Wrote local snapshot to {local_dir}/df_merged.csv")
-    if args.write_parquet:
-        df_merged.to_parquet(local_dir / "df_merged.parquet", index=False)
-
-    # Write processed layers (renamed already)
-    act_csv = abfs_path(args.container, "processed", "activity_merged.csv")
-    obe_csv = abfs_path(args.container, "processed", "obesity_merged.csv")
-    cur_csv = abfs_path(args.container, "curated",  "df_merged.csv")
-
-    df_activity.to_csv(act_csv, index=False, storage_options=opts)
-    df_obesity.to_csv (obe_csv, index=False, storage_options=opts)
-    df_merged.to_csv  (cur_csv, index=False, storage_options=opts)
-
-    LOG.info(f"Wrote CSV:\n  {act_csv}\n  {obe_csv}\n  {cur_csv}")
-
-    if args.write_parquet:
-        act_parq = abfs_path(args.container, "processed", "activity_merged.parquet")
-        obe_parq = abfs_path(args.container, "processed", "obesity_merged.parquet")
-        cur_parq = abfs_path(args.container, "curated",  "df_merged.parquet")
-        df_activity.to_parquet(act_parq, index=False, storage_options=opts)
-        df_obesity.to_parquet (obe_parq, index=False, storage_options=opts)
-        df_merged.to_parquet  (cur_parq, index=False, storage_options=opts)
-        LOG.info(f"Wrote Parquet:\n  {act_parq}\n  {obe_parq}\n  {cur_parq}")
+    (local_dir / "df_merged.parquet").write_bytes(merged_parq)
+    LOG.info(f"Wrote local snapshot to {local_dir}/df_merged.parquet")
+    if merged_csv is not None:
+        (local_dir / "df_merged.csv").write_bytes(merged_csv)
+        LOG.info(f"Wrote local snapshot to {local_dir}/df_merged.csv")
+
+    # Write processed layers (renamed already); all I/O goes through the one fs instance
+    act_parq = noscheme_path(args.container, "processed", "activity_merged.parquet")
+    obe_parq = noscheme_path(args.container, "processed", "obesity_merged.parquet")
+    cur_parq = noscheme_path(args.container, "curated",  "df_merged.parquet")
+
+    run_concurrently([
+        partial(upload_frame, fs, df_activity,  act_parq),
+        partial(upload_frame, fs, df_obesity,   obe_parq),
+        partial(upload_bytes, fs, merged_parq,  cur_parq),
+    ])
+
+    LOG.info(f"Wrote Parquet:\n  {act_parq}\n  {obe_parq}\n  {cur_parq}")
+
+    if merged_csv is not None:
+        act_csv = noscheme_path(args.container, "processed", "activity_merged.csv")
+        obe_csv = noscheme_path(args.container, "processed", "obesity_merged.csv")
+        cur_csv = noscheme_path(args.container, "curated",  "df_merged.csv")
+        run_concurrently([
+            partial(upload_frame, fs, df_activity, act_csv),
+            partial(upload_frame, fs, df_obesity,  obe_csv),
+            partial(upload_bytes, fs, merged_csv,  cur_csv),
+        ])
+        LOG.info(f"Wrote CSV:\n  {act_csv}\n  {obe_csv}\n  {cur_csv}")
+
+    # Record which inputs the outputs now reflect, so an identical rerun can short-circuit
+    if fp is not None:
+        marker.parent.mkdir(parents=True, exist_ok=True)
+        marker.write_text(fp, encoding="utf-8")
+        LOG.info(f"Recorded input fingerprint {fp} in {marker}")
 
     return 0
 
@@ -226,6 +433,7 @@ if __name__ == "__main__":
 # - --sas      : SAS token (or set env ADLS_SAS)
 # - --ages     : Ages to process (default: 11 13 15)
 # - --activity-prefix / --obesity-prefix: Raw file name prefixes
+# - --write-csv: Also write CSV outputs (Parquet is always written)
 # - --dry-run  : Run validations only; skip writes
 # - --debug    : Verbose logs (DEBUG); otherwise INFO
 
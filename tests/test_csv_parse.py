@@ -0,0 +1,57 @@
+import io
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+
+from transform_merge import CSV_CONVERT_OPTIONS, has_nulls, read_measure
+
+class StubFS:
+    """Minimal stand-in for AzureBlobFileSystem.open() over in-memory blobs."""
+    def __init__(self, blobs):
+        self.blobs = blobs
+
+    def open(self, path, mode="rb"):
+        return io.BytesIO(self.blobs[path])
+
+def _parse(data: bytes):
+    return pa_csv.read_csv(pa.BufferReader(data), convert_options=CSV_CONVERT_OPTIONS).to_pandas()
+
+def test_empty_key_cell_parses_as_null():
+    df = _parse(b"COUNTRY,SEX,YEAR,VALUE\n,MALE,2009,1\nARM,,2009,2\n")
+    assert df["COUNTRY"].isna().tolist() == [True, False]
+    assert df["SEX"].isna().tolist() == [False, True]
+    assert has_nulls(df["COUNTRY"]) and has_nulls(df["SEX"])
+
+def test_no_data_value_parses_as_nan():
+    df = _parse(b"COUNTRY,SEX,YEAR,VALUE\nARM,MALE,2009,No data\nARM,FEMALE,2009,20.6\n")
+    assert df["VALUE"].dtype == np.float64
+    assert np.isnan(df["VALUE"].iloc[0])
+    assert df["VALUE"].iloc[1] == 20.6
+
+def test_read_measure_no_data_value_is_nan():
+    fs = StubFS({
+        "c/raw/p 11-year-olds.csv": (
+            b"Intro\n"
+            b'"COUNTRY","SEX","YEAR","VALUE"\n'
+            b'"ARM","MALE","2009","No data"\n'
+            b'"ARM","FEMALE","2009","20.6"\n'
+            b"\n"
+            b'"Last update","2022.12.05"\n'
+        ),
+    })
+    df = read_measure(fs, "c", [11], "p")
+    assert len(df) == 2
+    assert np.isnan(df["VALUE"].iloc[0])
+    assert df["VALUE"].iloc[1] == 20.6
+    assert df["YEAR"].dtype == np.int16 and df["AGE"].dtype == np.int8
+
+def test_read_measure_missing_year_raises():
+    fs = StubFS({
+        "c/raw/p 11-year-olds.csv": b"COUNTRY,SEX,YEAR,VALUE\nARM,MALE,,34.3\n",
+    })
+    try:
+        read_measure(fs, "c", [11], "p")
+        assert False, "Expected ValueError"
+    except ValueError:
+        assert True
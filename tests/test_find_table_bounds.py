@@ -1,8 +1,11 @@
-from transform_merge import find_table_bounds
+from transform_merge import scan_table_bounds
 
-def _lines(text: str):
-    # Split preserving newline behavior; function expects a sequence of lines
-    return text.splitlines(True)
+COLS = ("COUNTRY","SEX","YEAR","VALUE")
+
+def _bounds(text: str):
+    # scan_table_bounds works on the raw file bytes; keep only (header_idx, data_rows)
+    header_idx, data_rows, _, _ = scan_table_bounds(text.encode("utf-8"), COLS)
+    return header_idx, data_rows
 
 def test_find_table_bounds_simple():
     text = (
@@ -13,7 +16,7 @@ def test_find_table_bounds_simple():
         "ARM,FEMALE,2009,20.6\n"
         "Last update,2022.12.05\n"
     )
-    header_idx, data_rows = find_table_bounds(_lines(text), ("COUNTRY","SEX","YEAR","VALUE"))
+    header_idx, data_rows = _bounds(text)
     assert header_idx == 2
     assert data_rows == 2  # two contiguous data lines after header
 
@@ -24,14 +27,53 @@ def test_find_table_bounds_no_footer_counts_to_end():
         "AUT,MALE,2005,29\n"
         "AUT,FEMALE,2005,23\n"
     )
-    header_idx, data_rows = find_table_bounds(_lines(text), ("COUNTRY","SEX","YEAR","VALUE"))
+    header_idx, data_rows = _bounds(text)
     assert header_idx == 1
     assert data_rows == 2  # counts until file ends
 
 def test_find_table_bounds_raises_if_no_header():
     text = "Metadata only\nNo columns here\n"
     try:
-        find_table_bounds(_lines(text), ("COUNTRY","SEX","YEAR","VALUE"))
+        _bounds(text)
         assert False, "Expected ValueError"
     except ValueError:
         assert True
+
+def test_find_table_bounds_crlf_and_footer():
+    text = (
+        "\ufeffSome metadata\r\n"
+        "COUNTRY,SEX,YEAR,VALUE\r\n"
+        "ARM,MALE,2009,34.3\r\n"
+        "ARM,FEMALE,2009,20.6\r\n"
+        "\r\n"
+        "Last update,2022.12.05"
+    )
+    header_idx, data_rows = _bounds(text)
+    assert header_idx == 1
+    assert data_rows == 2  # blank line ends the table
+
+def test_find_table_bounds_last_row_without_newline():
+    text = "COUNTRY,SEX,YEAR,VALUE\nAUT,MALE,2005,29\nAUT,FEMALE,2005,23"
+    header_idx, data_rows = _bounds(text)
+    assert header_idx == 0
+    assert data_rows == 2
+
+def test_find_table_bounds_header_must_be_on_one_line():
+    text = "COUNTRY,SEX\nYEAR,VALUE\nARM,MALE,2009,34.3\n"
+    try:
+        _bounds(text)
+        assert False, "Expected ValueError"
+    except ValueError:
+        assert True
+
+def test_scan_table_bounds_byte_offsets():
+    data = (
+        b"Intro\n"
+        b"More intro\n"
+        b"COUNTRY,SEX,YEAR,VALUE\n"
+        b"AUT,MALE,2005,29\n"
+        b"Last update,2022.12.05\n"
+    )
+    header_idx, data_rows, header_offset, table_end = scan_table_bounds(data, COLS)
+    assert (header_idx, data_rows) == (2, 1)
+    assert data[header_offset:table_end] == b"COUNTRY,SEX,YEAR,VALUE\nAUT,MALE,2005,29\n"
@@ -0,0 +1,33 @@
+import pandas as pd
+
+from transform_merge import IdPool
+
+def test_id_pool_ids_stable_across_calls_and_align():
+    pool = IdPool()
+    first = pool.codes("COUNTRY", pd.Series(["AUT", "ARM", "AUT"]))
+    second = pool.codes("COUNTRY", pd.Series(["BEL", "AUT", None]))
+
+    aut, arm = pool.country_to_id["AUT"], pool.country_to_id["ARM"]
+    assert list(first) == [aut, arm, aut]
+    assert list(second) == [pool.country_to_id["BEL"], aut, -1]  # null stays null
+
+    df = pd.DataFrame({
+        "COUNTRY": pool.categorical("COUNTRY", first),
+        "SEX": pool.categorical("SEX", pool.codes("SEX", pd.Series(["MALE", "FEMALE", "MALE"]))),
+    })
+    pool.codes("SEX", pd.Series(["TOTAL"]))  # pool grows after df was built
+    pool.align(df)
+    assert list(df["COUNTRY"].cat.categories) == list(pool.country_to_id)
+    assert list(df["SEX"].cat.categories) == list(pool.sex_to_id)
+    assert list(df["COUNTRY"].cat.codes) == [aut, arm, aut]
+    assert list(df["COUNTRY"]) == ["AUT", "ARM", "AUT"]
+    assert list(df["SEX"]) == ["MALE", "FEMALE", "MALE"]
+
+def test_id_pool_rejects_unknown_column():
+    pool = IdPool()
+    try:
+        pool.codes("YEAR", pd.Series([2009]))
+        assert False, "Expected KeyError"
+    except KeyError:
+        assert True
+    assert not pool.country_to_id and not pool.sex_to_id
@@ -0,0 +1,51 @@
+from transform_merge import input_fingerprint, outputs_current
+
+PATHS = ["c/raw/a 11-year-olds.csv", "c/raw/b 11-year-olds.csv"]
+
+class StubFS:
+    """Minimal stand-in for AzureBlobFileSystem.info()."""
+    def __init__(self, infos):
+        self.infos = infos
+
+    def info(self, path):
+        return dict(self.infos[path])
+
+def _fs():
+    return StubFS({
+        PATHS[0]: {"etag": "0x1", "size": 100},
+        PATHS[1]: {"etag": "0x2", "size": 200},
+    })
+
+def test_input_fingerprint_tracks_blob_versions_and_options():
+    fs = _fs()
+    fp = input_fingerprint(fs, PATHS, "c", False)
+    assert fp == input_fingerprint(fs, list(reversed(PATHS)), "c", False)  # order-insensitive
+    assert fp != input_fingerprint(fs, PATHS, "c", True)                   # output options count
+    assert fp != input_fingerprint(fs, PATHS[:1], "c", False)              # different input set
+
+    fs.infos[PATHS[0]]["etag"] = "0x9"  # same size, edited blob
+    assert fp != input_fingerprint(fs, PATHS, "c", False)
+
+def test_input_fingerprint_without_version_disables_cache():
+    fs = _fs()
+    del fs.infos[PATHS[1]]["etag"]
+    fs.infos[PATHS[1]]["last_modified"] = "2025-01-01T00:00:00Z"
+    assert input_fingerprint(fs, PATHS, "c", False) is not None
+
+    del fs.infos[PATHS[1]]["last_modified"]
+    assert input_fingerprint(fs, PATHS, "c", False) is None
+
+def test_outputs_current_skip_and_force(tmp_path):
+    marker = tmp_path / "last_fingerprint"
+    fs = _fs()
+    fp_full = input_fingerprint(fs, PATHS, "c", False)
+    fp_subset = input_fingerprint(fs, PATHS[:1], "c", False)
+
+    assert not outputs_current(marker, fp_full)         # no successful run yet
+    marker.write_text(fp_full, encoding="utf-8")
+    assert outputs_current(marker, fp_full)             # identical rerun -> skip
+    assert not outputs_current(marker, fp_full, force=True)
+    assert not outputs_current(marker, None)            # uncacheable inputs never skip
+
+    marker.write_text(fp_subset, encoding="utf-8")      # a run on other inputs overwrote outputs
+    assert not outputs_current(marker, fp_full)
@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+
+from transform_merge import has_nulls, top_duplicate_keys, validate_keys
+
+KEYS = ["COUNTRY", "AGE", "SEX", "YEAR"]
+
+def _frame(countries, years):
+    return pd.DataFrame({
+        "COUNTRY": pd.Categorical(countries),
+        "SEX": pd.Categorical(["MALE"] * len(countries)),
+        "YEAR": np.array(years, dtype=np.int16),
+        "VALUE": np.arange(len(countries), dtype=np.float64),
+        "AGE": np.full(len(countries), 11, dtype=np.int8),
+    })
+
+def test_has_nulls_dispatch():
+    assert has_nulls(pd.Series(pd.Categorical(["AUT", None])))
+    assert not has_nulls(pd.Series(pd.Categorical(["AUT", "ARM"])))
+    assert has_nulls(pd.Series([1.0, np.nan]))
+    assert not has_nulls(pd.Series([1.0, 2.0]))
+    assert not has_nulls(pd.Series(np.array([2005, 2009], dtype=np.int16)))
+    assert has_nulls(pd.Series(["AUT", None], dtype=object))
+
+def test_validate_keys_passes_clean_frame():
+    validate_keys(_frame(["AUT", "ARM"], [2009, 2009]), KEYS, "clean")
+
+def test_validate_keys_rejects_null_keys():
+    try:
+        validate_keys(_frame(["AUT", None], [2009, 2009]), KEYS, "activity")
+        assert False, "Expected AssertionError"
+    except AssertionError as e:
+        assert "activity has null key values" in str(e)
+
+def test_validate_keys_rejects_duplicate_keys():
+    try:
+        validate_keys(_frame(["AUT", "AUT", "ARM"], [2009, 2009, 2009]), KEYS, "obesity")
+        assert False, "Expected AssertionError"
+    except AssertionError as e:
+        assert "obesity has 2 duplicate rows on keys" in str(e)
+        assert "AUT" in str(e)  # top combos come from value_counts on the dup rows
+
+def test_duplicate_report_lists_only_observed_combos():
+    df = _frame(["AUT", "AUT"], [2009, 2009])
+    # Pool-aligned categoricals carry categories that never occur in this frame
+    df["COUNTRY"] = df["COUNTRY"].cat.set_categories(["AUT", "ARM", "BEL", "CZE"])
+    df["SEX"] = df["SEX"].cat.set_categories(["MALE", "FEMALE"])
+
+    top = top_duplicate_keys(df, KEYS, df.duplicated(subset=KEYS, keep=False))
+    assert len(top) == 1
+    assert (top > 1).all()
+    assert top.index[0] == ("AUT", 11, "MALE", 2009)
+
+    try:
+        validate_keys(df, KEYS, "activity")
+        assert False, "Expected AssertionError"
+    except AssertionError as e:
+        assert "activity has 2 duplicate rows on keys" in str(e)
+        assert "ARM" not in str(e) and "FEMALE" not in str(e)